@@ -0,0 +1,192 @@
+import numba
+import numpy as np
+
+# Compiled numeric helpers shared by the pages. Pages are re-executed on every
+# rerun, so kernels live in this importable module to be jitted once per process.
+
+@numba.njit(cache=True)
+def scale_row(raw, inv_scale, offset, out):
+    """Expand 8 raw features with the polynomial terms and standardize into out."""
+    for i in range(8):
+        out[i] = raw[i] * inv_scale[i] + offset[i]
+    age = raw[0]
+    glu = raw[1]
+    out[8]  = age * age * inv_scale[8]  + offset[8]
+    out[9]  = age * glu * inv_scale[9]  + offset[9]
+    out[10] = glu * glu * inv_scale[10] + offset[10]
+    return out
+
+# ── Boosted trees as flat node arrays ────────────────────────────────────────
+def _node_expectations(tree):
+    # Leaf values are line-search updated, so rebuild internal means from leaves
+    value = tree.value[:, 0, 0].copy()
+    w     = tree.weighted_n_node_samples
+    left, right = tree.children_left, tree.children_right
+    for i in range(tree.node_count - 1, -1, -1):
+        l, r = left[i], right[i]
+        if l >= 0:
+            value[i] = (w[l] * value[l] + w[r] * value[r]) / (w[l] + w[r])
+    return value
+
+def _float32_thresholds(threshold):
+    # Round down so `x32 <= t32` splits exactly like sklearn's `x32 <= t64`
+    t32  = threshold.astype(np.float32)
+    over = t32 > threshold
+    t32[over] = np.nextafter(t32[over], np.float32(-np.inf))
+    return t32
+
+def flatten_trees(model):
+    """Concatenate every boosting stage of a binary GradientBoostingClassifier into node arrays.
+
+    Returns (feature, threshold, left, right, expect, cover, roots, max_depth); children
+    index the concatenated arrays, and expect is each node's learning-rate scaled mean.
+    """
+    trees   = [est.tree_ for est in model.estimators_[:, 0]]
+    roots   = np.cumsum([0] + [t.node_count for t in trees])[:-1]
+    feature   = np.concatenate([t.feature for t in trees])
+    threshold = _float32_thresholds(np.concatenate([t.threshold for t in trees]))
+    left  = np.concatenate([np.where(t.children_left  >= 0, t.children_left  + o, -1) for t, o in zip(trees, roots)])
+    right = np.concatenate([np.where(t.children_right >= 0, t.children_right + o, -1) for t, o in zip(trees, roots)])
+    expect = np.concatenate([_node_expectations(t) for t in trees]) * model.learning_rate
+    cover  = np.concatenate([t.weighted_n_node_samples for t in trees])
+    max_depth = max(t.max_depth for t in trees)
+    return feature, threshold, left, right, expect, cover, roots, max_depth
+
+@numba.njit(cache=True)
+def predict_margin(x, feature, threshold, left, right, value, roots):
+    """Sum over all trees of the leaf value one float32 row lands in."""
+    total = 0.0
+    for node in roots:
+        while left[node] >= 0:
+            node = left[node] if x[feature[node]] <= threshold[node] else right[node]
+        total += value[node]
+    return total
+
+# ── TreeSHAP, precomputed per leaf (FastTreeSHAP v2) ──────────────────────────
+# A leaf's path-dependent SHAP values depend on the row only through which of its
+# unique path features the row satisfies, so every pattern is tabulated offline
+# and explaining a row is one interval test and one lookup per path feature.
+
+@numba.njit(cache=True)
+def leaf_tables(feature, threshold, left, right, value, cover, roots, max_depth):
+    """Flatten every root-to-leaf path and tabulate its SHAP values per satisfied mask."""
+    n_leaves = 0
+    for i in range(left.shape[0]):
+        if left[i] < 0:
+            n_leaves += 1
+    seg = max_depth + 1
+    # Unique path at each tree depth: feature, zero fraction, satisfied interval (lo, hi]
+    pf  = np.empty(seg * seg, dtype=np.int64)
+    pz  = np.empty(seg * seg)
+    plo = np.empty(seg * seg, dtype=np.float32)
+    phi = np.empty(seg * seg, dtype=np.float32)
+    pk  = np.empty(seg, dtype=np.int64)
+    path_start = np.zeros(n_leaves + 1, dtype=np.int64)
+    path_feat  = np.empty(n_leaves * max_depth, dtype=np.int64)
+    path_zero  = np.empty(n_leaves * max_depth)
+    path_lo    = np.empty(n_leaves * max_depth, dtype=np.float32)
+    path_hi    = np.empty(n_leaves * max_depth, dtype=np.float32)
+    leaf_value = np.empty(n_leaves)
+    s_node   = np.empty(2 * seg, dtype=np.int64)
+    s_depth  = np.empty(2 * seg, dtype=np.int64)
+    s_parent = np.empty(2 * seg, dtype=np.int64)
+    n = 0
+    for root in roots:
+        top = 0
+        s_node[0] = root; s_depth[0] = 0; s_parent[0] = -1
+        while top >= 0:
+            node = s_node[top]; d = s_depth[top]; parent = s_parent[top]
+            top -= 1
+            s = d * seg
+            k = 0
+            if parent >= 0:
+                p = s - seg
+                k = pk[d - 1]
+                for i in range(k):
+                    pf[s + i] = pf[p + i]; pz[s + i] = pz[p + i]
+                    plo[s + i] = plo[p + i]; phi[s + i] = phi[p + i]
+                # A feature split on again earlier in the path is folded into one entry
+                f = feature[parent]
+                j = 0
+                while j < k and pf[s + j] != f:
+                    j += 1
+                if j == k:
+                    pf[s + j] = f; pz[s + j] = 1.0
+                    plo[s + j] = -np.inf; phi[s + j] = np.inf
+                    k += 1
+                pz[s + j] *= cover[node] / np.float64(cover[parent])
+                if node == left[parent]:
+                    phi[s + j] = min(phi[s + j], threshold[parent])
+                else:
+                    plo[s + j] = max(plo[s + j], threshold[parent])
+            pk[d] = k
+            if left[node] < 0:
+                a = path_start[n]
+                for i in range(k):
+                    path_feat[a + i] = pf[s + i]; path_zero[a + i] = pz[s + i]
+                    path_lo[a + i] = plo[s + i]; path_hi[a + i] = phi[s + i]
+                path_start[n + 1] = a + k
+                leaf_value[n] = value[node]
+                n += 1
+                continue
+            top += 1
+            s_node[top] = right[node]; s_depth[top] = d + 1; s_parent[top] = node
+            top += 1
+            s_node[top] = left[node]; s_depth[top] = d + 1; s_parent[top] = node
+
+    # Shapley weights |S|! (k - |S| - 1)! / k! for each path length k
+    fact = np.ones(seg + 1)
+    for i in range(1, seg + 1):
+        fact[i] = fact[i - 1] * i
+    weight = np.zeros((seg, seg))
+    for k in range(1, seg):
+        for m in range(k):
+            weight[k, m] = fact[m] * fact[k - m - 1] / fact[k]
+    table_start = np.zeros(n_leaves + 1, dtype=np.int64)
+    for l in range(n_leaves):
+        k = path_start[l + 1] - path_start[l]
+        table_start[l + 1] = table_start[l] + k * (1 << k)
+    table = np.empty(table_start[n_leaves], dtype=np.float32)
+    coef  = np.empty(seg + 1)
+    for l in range(n_leaves):
+        a = path_start[l]
+        k = path_start[l + 1] - a
+        for mask in range(1 << k):
+            for j in range(k):
+                # Coefficients of prod over the other features of (one * t + zero)
+                coef[0] = 1.0
+                deg = 0
+                for i in range(k):
+                    if i == j:
+                        continue
+                    o = (mask >> i) & 1
+                    z = path_zero[a + i]
+                    coef[deg + 1] = 0.0
+                    for m in range(deg + 1, 0, -1):
+                        coef[m] = coef[m] * z + coef[m - 1] * o
+                    coef[0] *= z
+                    deg += 1
+                total = 0.0
+                for m in range(k):
+                    total += weight[k, m] * coef[m]
+                table[table_start[l] + mask * k + j] = (
+                    leaf_value[l] * (((mask >> j) & 1) - path_zero[a + j]) * total
+                )
+    return path_start, path_feat, path_lo, path_hi, table_start, table
+
+@numba.njit(cache=True)
+def tree_shap(x, path_start, path_feat, path_lo, path_hi, table_start, table, out):
+    """Exact path-dependent TreeSHAP values of one row, summed over all leaves into out."""
+    out[:] = 0.0
+    for l in range(path_start.shape[0] - 1):
+        a = path_start[l]
+        k = path_start[l + 1] - a
+        mask = 0
+        for j in range(k):
+            v = x[path_feat[a + j]]
+            if path_lo[a + j] < v and v <= path_hi[a + j]:
+                mask |= 1 << j
+        t = table_start[l] + mask * k
+        for j in range(k):
+            out[path_feat[a + j]] += table[t + j]
+    return out
@@ -1,8 +1,6 @@
 import streamlit as st
 
-def show_navbar():
-    """Function to display the top navigation bar."""
-    st.markdown("""
+_NAVBAR_HTML = """
     <style>
     .navbar {
         background-color: #4CAF50;
@@ -27,4 +25,8 @@ def show_navbar():
         <a href="pages/Results.py">Results</a>
         <a href="pages/Recommendations.py">Recommendations</a>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def show_navbar():
+    """Function to display the top navigation bar."""
+    st.html(_NAVBAR_HTML)
@@ -1,19 +1,18 @@
+import textwrap
 import streamlit as st
 
-# ── Page configuration & styling ─────────────────────────────────────────────
-st.set_page_config(page_title="Stroke Risk Recommendations", layout="wide")
-st.markdown("""
-    <style>
-        #MainMenu, header {visibility: hidden;}
-        [data-testid="stSidebar"], [data-testid="collapsedControl"] {display: none;}
-    </style>
-""", unsafe_allow_html=True)
+# ── Static page chrome (hide defaults + custom navbar) ───────────────────────
+_NAV_LINKS = (
+    "<a href='/Home' target='_self'>Home</a>"
+    "<a href='/Risk_Assessment' target='_self'>Risk Assessment</a>"
+    "<a href='/Results' target='_self'>Results</a>"
+    "<a href='/Recommendations' target='_self'>Recommendations</a>"
+)
 
-st.title("💡 Stroke Prevention Recommendations")
-
-# ── Custom navbar ────────────────────────────────────────────────────────────
-st.markdown("""
+_STATIC_CHROME = """
     <style>
+        #MainMenu, footer, header {visibility: hidden;}
+        [data-testid="stSidebar"], [data-testid="collapsedControl"] {display: none;}
         .custom-nav {
             background-color: #e8f5e9;
             padding: 15px 0;
@@ -34,65 +33,103 @@ st.markdown("""
             text-decoration: underline;
         }
     </style>
-    <div class="custom-nav">
-        <a href='/Home' target='_self'>Home</a>
-        <a href='/Risk_Assessment' target='_self'>Risk Assessment</a>
-        <a href='/Results' target='_self'>Results</a>
-        <a href='/Recommendations' target='_self'>Recommendations</a>
+""" + f"""
+    <div class="custom-nav">{_NAV_LINKS}</div>
+"""
+
+_FOOTER_HTML = """
+    <style>
+        .custom-footer {
+            background-color: rgba(76, 157, 112, 0.6);
+            color: white;
+            padding: 30px 0;
+            border-radius: 12px;
+            margin-top: 40px;
+            text-align: center;
+            font-size: 14px;
+            width: 100%;
+        }
+        .custom-footer a {
+            color: white;
+            text-decoration: none;
+            margin: 0 15px;
+        }
+        .custom-footer a:hover {
+            text-decoration: underline;
+        }
+    </style>
+""" + f"""
+    <div class="custom-footer">
+        <p>&copy; 2025 Stroke Risk Assessment Tool | All rights reserved</p>
+        <p>{_NAV_LINKS}</p>
+        <p style="font-size:12px; margin-top:10px;">Developed by Victoria Mends</p>
     </div>
-""", unsafe_allow_html=True)
+"""
+
+# ── Page configuration & styling ─────────────────────────────────────────────
+st.set_page_config(page_title="Stroke Risk Recommendations", layout="wide",
+                   initial_sidebar_state="collapsed")
+st.title("💡 Stroke Prevention Recommendations")
 
 # ── Retrieve risk score from session ──────────────────────────────────────────
-risk_prob = st.session_state.get("prediction_prob")
-if risk_prob is None:
+# Bail out before any chrome is emitted when there is nothing to show
+if "prediction_prob" not in st.session_state:
     st.warning("⚠️ No stroke risk score found. Please complete the assessment first.")
     # Redirect user to input their data
     st.page_link("pages/Risk_Assessment.py", label="Go to Risk Assessment")
     st.stop()
 
+st.html(_STATIC_CHROME)
+
 # Convert to percentage
+risk_prob  = st.session_state.prediction_prob
 risk_score = risk_prob * 100
-st.markdown(f"### 🧠 Your estimated stroke risk is **{risk_score:.2f}%**.")
+st.subheader(f"🧠 Your estimated stroke risk is {risk_score:.2f}%")
 
 # ── Personalized recommendations ──────────────────────────────────────────────
-st.subheader("🎯 Personalized Recommendations")
-
-# Special case: zero risk
-if risk_score == 0:
-    st.balloons()
-    st.success("🎉 Incredible! Your calculated stroke risk is 0.00%. Keep up these great habits!")
-    st.markdown("""
+_ZERO = textwrap.dedent("""\
     - Continue your current healthy lifestyle habits.
     - Maintain balanced diet, regular exercise, and stress management.
     - Keep up routine health checkups to stay on track.
-    """)
-
-elif risk_score < 30:
-    st.success("✅ You have a low risk. Keep up the good work!")
-    st.markdown("""
+""")
+_LOW = textwrap.dedent("""\
     - Keep up with regular health checkups.
     - Maintain a balanced diet and exercise.
     - Avoid smoking and manage stress effectively.
-    """)
-
-elif risk_score < 70:
-    st.warning("⚠️ You are at moderate risk. Take proactive steps to lower it.")
-    st.markdown("""
+""")
+_MODERATE = textwrap.dedent("""\
     - Monitor and manage blood pressure and glucose levels.
     - Limit alcohol intake and avoid smoking.
     - Consider lifestyle modifications like increasing physical activity.
-    """)
-
-else:
-    st.error("🚨 You are at high risk. Please take immediate action.")
-    st.markdown("""
+""")
+_HIGH = textwrap.dedent("""\
     - Seek medical advice for detailed cardiovascular assessment.
     - Take prescribed medications if necessary (e.g., antihypertensives).
     - Adopt a strict healthy diet and consistent physical activity routine.
     - Completely avoid tobacco products and excessive alcohol.
-    """)
+""")
+
+# Status widget, message and markdown body shown for each risk tier
+_TIERS = {
+    "zero":     (st.success, "🎉 Incredible! Your calculated stroke risk is 0.00%. Keep up these great habits!", _ZERO),
+    "low":      (st.success, "✅ You have a low risk. Keep up the good work!", _LOW),
+    "moderate": (st.warning, "⚠️ You are at moderate risk. Take proactive steps to lower it.", _MODERATE),
+    "high":     (st.error,   "🚨 You are at high risk. Please take immediate action.", _HIGH),
+}
+
+st.subheader("🎯 Personalized Recommendations")
+
+tier = "zero" if risk_score == 0 else "low" if risk_score < 30 else "moderate" if risk_score < 70 else "high"
+show_status, status, body = _TIERS[tier]
 
-# ── General tips ──────────────────────────────────────────────────────────────
+# Special case: zero risk — celebrate once per session
+if tier == "zero" and not st.session_state.get("_balloons_shown"):
+    st.balloons()
+    st.session_state["_balloons_shown"] = True
+show_status(status)
+st.markdown(body)
+
+# ── General tips, navigation & footer ─────────────────────────────────────────
 st.subheader("📌 General Stroke Prevention Tips")
 st.markdown("""
 - Discuss these results with your healthcare provider.
@@ -104,7 +141,7 @@ st.markdown("""
 - Monitor chronic conditions like diabetes or hypertension.
 """)
 
-# ── Navigation buttons ─────────────────────────────────────────────────────────
+# Navigation buttons; page_link switches pages within the session
 col1, col2 = st.columns(2)
 with col1:
     # Use file path for Risk_Assessment page
@@ -113,36 +150,4 @@ with col2:
     # Link back to main app
     st.page_link("app.py", label="🏠 Back to Home")
 
-# ── Footer ─────────────────────────────────────────────────────────────────────
-st.markdown("""
-    <style>
-        .custom-footer {
-            background-color: rgba(76, 157, 112, 0.6);
-            color: white;
-            padding: 30px 0;
-            border-radius: 12px;
-            margin-top: 40px;
-            text-align: center;
-            font-size: 14px;
-            width: 100%;
-        }
-        .custom-footer a {
-            color: white;
-            text-decoration: none;
-            margin: 0 15px;
-        }
-        .custom-footer a:hover {
-            text-decoration: underline;
-        }
-    </style>
-    <div class="custom-footer">
-        <p>&copy; 2025 Stroke Risk Assessment Tool | All rights reserved</p>
-        <p>
-            <a href='/Home'>Home</a>
-            <a href='/Risk_Assessment'>Risk Assessment</a>
-            <a href='/Results'>Results</a>
-            <a href='/Recommendations'>Recommendations</a>
-        </p>
-        <p style="font-size:12px; margin-top:10px;">Developed by Victoria Mends</p>
-    </div>
-""", unsafe_allow_html=True)
+st.html(_FOOTER_HTML)
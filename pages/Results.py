@@ -1,61 +1,18 @@
 import os
-import joblib
 import streamlit as st
-import numpy as np
-import shap
-import plotly.graph_objects as go
 
 # ── Page config must be first ─────────────────────────────────────────────────
+st.set_page_config(page_title="Stroke Risk Results", layout="wide")
 
+# ── Static chrome: CSS, header & navbar in one element ────────────────────────
+_NAV_LINKS = (
+    "<a href='/Home'>Home</a> "
+    "<a href='/Risk_Assessment'>Risk Assessment</a> "
+    "<a href='/Results'>Results</a> "
+    "<a href='/Recommendations'>Recommendations</a>"
+)
 
-
-# ── Polynomial feature helper ─────────────────────────────────────────────────
-def add_poly(X):
-    # X shape: (n_samples, 8) raw features
-    age    = X[:, 0]
-    glu    = X[:, 1]
-    age_sq = age ** 2
-    inter  = age * glu
-    glu_sq = glu ** 2
-    return np.c_[X, age_sq, inter, glu_sq]
-
-# ── Scaler parameters from training ────────────────────────────────────────────
-SCALER_MEAN = np.array([
-    47.4572, 106.1478,  # age, glucose
-    0.0482, 0.0513,     # heart_disease, hypertension
-    0.5527, 0.5431,     # ever_married, smoking_status
-    2.1356, 0.5064,     # work_type, gender
-    1850.37, 5067.84, 11645.2  # age_sq, inter, glu_sq
-])
-SCALER_SCALE = np.array([
-    15.6753, 26.8145,
-    0.2141, 0.2206,
-    0.4974, 0.4983,
-    0.9082, 0.4999,
-    2978.41, 6144.78, 10795.6
-])
-
-# ── Load bare model for prediction and SHAP ───────────────────────────────────
-@st.cache_resource
-# Cache the model loading; no hashing of large objects
-def load_model():
-    base = os.path.dirname(os.path.abspath(__file__))
-    path = os.path.join(base, "best_gb_model.pkl")
-    return joblib.load(path)
-
-model = load_model()
-
-# ── SHAP explainer ─────────────────────────────────────────────────────────────
-@st.cache_resource
-# Use underscore to prevent hashing the model object
-def load_explainer(_model):
-    return shap.TreeExplainer(_model)
-
-explainer = load_explainer(model)
-
-# ── Page config & CSS ─────────────────────────────────────────────────────────
-st.set_page_config(page_title="Stroke Risk Results", layout="wide")
-st.markdown("""
+_STATIC_CHROME = """
     <style>
       #MainMenu, footer, header {visibility: hidden;}
       [data-testid="stSidebar"], [data-testid="collapsedControl"] {display: none;}
@@ -78,119 +35,250 @@ st.markdown("""
         .custom-nav a:hover { color: #fff !important; }
       }
     </style>
-""", unsafe_allow_html=True)
-
-# ── Header & Navbar ───────────────────────────────────────────────────────────
-st.markdown("""
+""" + f"""
   <div class="header-container">
     <h1>📊 Stroke Risk Results</h1>
   </div>
-  <div class="custom-nav">
-    <a href='/Home'>Home</a>
-    <a href='/Risk_Assessment'>Risk Assessment</a>
-    <a href='/Results'>Results</a>
-    <a href='/Recommendations'>Recommendations</a>
-  </div>
-""", unsafe_allow_html=True)
-
-# ── Display results & SHAP contributions ───────────────────────────────────────
-if "user_data" in st.session_state and "prediction_prob" in st.session_state:
-    prob = st.session_state.prediction_prob
-    pct  = prob * 100
-
-    st.markdown(f"### 🧠 Your Stroke Percentage Risk: **{pct:.2f}%**")
-    st.write("---")
-
-    UD = st.session_state.user_data
-    # Rebuild raw feature vector in training order
-    raw = [
-    UD["age"],
-    UD["avg_glucose_level"],
-    1 if UD["heart_disease"] == "Yes" else 0,
-    1 if UD["hypertension"] == "Yes" else 0,
-    1 if UD["ever_married"] == "Yes" else 0,
-    {"formerly smoked": 0, "smokes": 2, "never smoked": 1}[UD["smoking_status"]],
-    {"Private": 2, "Govt_job": 0, "Self-employed": 3, "Never_worked": 1}[UD["work_type"]],
-    {"Male": 1, "Female": 0}[UD["gender"]]
-]
-    X_raw    = np.array(raw).reshape(1, -1)
-    X_poly   = add_poly(X_raw)
-    X_scaled = (X_poly - SCALER_MEAN) / SCALER_SCALE
-
-    # SHAP values
-    sv        = explainer.shap_values(X_scaled)
-    shap_vals = sv[1][0] if isinstance(sv, list) else sv[0]
-    vals      = np.abs(shap_vals[:8])
-    contrib   = vals / vals.sum() * prob
-
-    feature_names = [
-      "Age", "Avg Glucose", "Heart Disease", "Hypertension",
-      "Ever Married", "Smoking Status", "Work Type", "Gender"
-    ]
-    palette = ["brown","gold","steelblue","purple"]
-    colors  = [palette[i % len(palette)] for i in range(len(feature_names))]
-
-    # Contribution bar chart
-    bar_fig = go.Figure(
-        go.Bar(x=feature_names,
-               y=contrib * 100,
-               marker=dict(color=colors),
-               text=[f"{v*100:.2f}%" for v in contrib],
-               textposition="outside")
-    )
-    bar_fig.update_layout(
-        template="plotly_white",
-        title="How Each Input Contributed to Your Total Risk",
-        yaxis=dict(title="Contribution to Risk (%)", range=[0,100], ticksuffix="%"),
-        xaxis=dict(tickangle=-45),
-        margin=dict(t=60, b=120)
-    )
-    st.plotly_chart(bar_fig, use_container_width=True)
-
-    # Gauge chart
-    r = int(255 * prob)
-    g = int(255 * (1 - prob))
-    bar_color = f"rgb({r},{g},0)"
-    gauge_fig = go.Figure(
-        go.Indicator(
-            mode="gauge+number",
-            value=pct,
-            number={'suffix': "%"},
-            title={'text': "Overall Stroke Risk (%)"},
-            gauge={
-                'axis': {'range': [0,100], 'ticksuffix': '%'},
-                'bar': {'color': bar_color},
-                'steps': [{'range': [0,50], 'color': 'green'}, {'range': [50,100], 'color': 'red'}]
-            }
-        )
-    )
-    gauge_fig.update_layout(template="plotly_white", margin=dict(t=40, b=0, l=0, r=0))
-    st.plotly_chart(gauge_fig, use_container_width=True)
-
-    # Navigation buttons
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("🔙 Back to Assessment"):
-            st.switch_page("pages/Risk_Assessment.py")
-    with col2:
-        if st.button("📘 Recommendations"):
-            st.switch_page("pages/Recommendations.py")
-else:
-    st.warning("No input data found. Please complete the Risk Assessment first.")
+  <div class="custom-nav">{_NAV_LINKS}</div>
+"""
+st.markdown(_STATIC_CHROME, unsafe_allow_html=True)
 
 # ── Footer ────────────────────────────────────────────────────────────────────
-st.markdown("""
+_FOOTER_HTML = """
   <style>
     .custom-footer { background-color: rgba(76,157,112,0.6); color: white; padding: 30px 0; border-radius: 12px; margin-top: 40px; text-align: center; font-size: 14px; width: 100%; }
     .custom-footer a { color: white; text-decoration: none; margin: 0 15px; }
     .custom-footer a:hover { text-decoration: underline; }
   </style>
+""" + f"""
   <div class="custom-footer">
       <p>&copy; 2025 Stroke Risk Assessment Tool | All rights reserved</p>
-      <p><a href='/Home'>Home</a> <a href='/Risk_Assessment'>Risk Assessment</a> <a href='/Results'>Results</a> <a href='/Recommendations'>Recommendations</a></p>
+      <p>{_NAV_LINKS}</p>
       <p style="font-size:12px;">Developed by Victoria Mends</p>
   </div>
-""", unsafe_allow_html=True)
+"""
+
+# ── Nothing to show: stop before importing the model stack ───────────────────
+if "user_data" not in st.session_state or "prediction_prob" not in st.session_state:
+    st.warning("No input data found. Please complete the Risk Assessment first.")
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+    st.stop()
+
+# Heavy imports are deferred until there are results to render
+import pickle
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+from kernels import flatten_trees, leaf_tables, scale_row, tree_shap
+
+# ── Scaler parameters from training ────────────────────────────────────────────
+SCALER_MEAN = np.array([
+    47.4572, 106.1478,  # age, glucose
+    0.0482, 0.0513,     # heart_disease, hypertension
+    0.5527, 0.5431,     # ever_married, smoking_status
+    2.1356, 0.5064,     # work_type, gender
+    1850.37, 5067.84, 11645.2  # age_sq, inter, glu_sq
+], dtype=np.float32)
+SCALER_SCALE = np.array([
+    15.6753, 26.8145,
+    0.2141, 0.2206,
+    0.4974, 0.4983,
+    0.9082, 0.4999,
+    2978.41, 6144.78, 10795.6
+], dtype=np.float32)
+# Polynomial expansion + scaling collapse into one affine pass (see scale_row);
+# float32 end to end, the precision the trees split at anyway
+INV_SCALE           = 1.0 / SCALER_SCALE
+NEG_MEAN_OVER_SCALE = -SCALER_MEAN * INV_SCALE
+_RAW = np.empty(8, dtype=np.float32)
+_BUF = np.empty(11, dtype=np.float32)
+
+# ── Categorical encodings used at training time ───────────────────────────────
+YES_NO  = {"Yes": 1, "No": 0}
+SMOKING = {"formerly smoked": 0, "smokes": 2, "never smoked": 1}
+WORK    = {"Private": 2, "Govt_job": 0, "Self-employed": 3, "Never_worked": 1}
+GENDER  = {"Male": 1, "Female": 0}
+
+# ── Load bare model for prediction and SHAP ───────────────────────────────────
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "best_gb_model.pkl")
+
+@st.cache_resource(max_entries=1)
+# Cache the model loading; no hashing of large objects. One copy per process,
+# keyed on the pickle's mtime so a redeployed model replaces the old one
+def load_model(model_mtime):
+    # Plain pickle (not a joblib dump): the C unpickler is several times faster
+    with open(MODEL_PATH, "rb") as f:
+        return pickle.load(f)
+
+# ── Feature attributions ──────────────────────────────────────────────────────
+# Exact TreeSHAP by default; False switches to cheaper path (Saabas) attributions
+USE_SHAP = True
+
+@st.cache_resource(max_entries=1)
+# Flatten every boosting stage into node arrays (float32 values, ~0.8 MB) once per
+# process, from the model loaded under the same mtime so the two always agree
+def load_tree_tables(model_mtime):
+    feature, threshold, left, right, expect, cover, roots, max_depth = flatten_trees(
+        load_model(model_mtime))
+    return (feature, threshold, left, right, expect.astype(np.float32), cover.astype(np.float32),
+            roots, max_depth)
+
+@st.cache_resource(max_entries=1)
+# Per-leaf SHAP lookup tables (~6.9 MB), tabulated once per process in well under a second
+def load_shap_tables(model_mtime):
+    return leaf_tables(*load_tree_tables(model_mtime))
+
+model_mtime = os.path.getmtime(MODEL_PATH)
+tree_tables = load_tree_tables(model_mtime)
+shap_tables = load_shap_tables(model_mtime) if USE_SHAP else None
+
+def path_contrib(x):
+    # Walk all trees in lockstep, crediting each split's change in expectation
+    feature, threshold, left, right, expect, _, roots, _ = tree_tables
+    contrib = np.zeros(x.shape[0], dtype=expect.dtype)
+    node    = roots.copy()
+    active  = left[node] >= 0
+    while active.any():
+        n     = node[active]
+        f     = feature[n]
+        child = np.where(x[f] <= threshold[n], left[n], right[n])
+        np.add.at(contrib, f, expect[child] - expect[n])
+        node[active] = child
+        active = left[node] >= 0
+    return contrib
+
+@st.cache_data(max_entries=4096, ttl=3600)
+# Keyed on the rounded raw tuple so repeat and nearby inputs skip the attribution,
+# and on the model's mtime so a swapped model never serves the old attributions
+def compute_contrib(raw, model_mtime):
+    # Store straight into the preallocated buffers; no intermediate arrays
+    _RAW[:] = raw
+    x = scale_row(_RAW, INV_SCALE, NEG_MEAN_OVER_SCALE, _BUF)
+    if not USE_SHAP:
+        return path_contrib(x)[:8]
+    return tree_shap(x, *shap_tables, np.zeros(x.shape[0]))[:8].astype(np.float32)
+
+# ── Chart styling ─────────────────────────────────────────────────────────────
+@st.cache_resource
+# Figures are built with validation off, which leaves a template name unresolved
+def load_template():
+    return pio.templates["plotly_white"].to_plotly_json()
+
+template = load_template()
+
+FEATURE_NAMES = (
+    "Age", "Avg Glucose", "Heart Disease", "Hypertension",
+    "Ever Married", "Smoking Status", "Work Type", "Gender",
+)
+BAR_PALETTE = ("#A52A2A", "#FFD700", "#4682B4", "#800080")  # brown, gold, steelblue, purple
+BAR_COLORS  = BAR_PALETTE * 2
+
+# Bar and gauge share one figure, split 70/30 as make_subplots would lay them out
+BAR_DOMAIN   = [0.0, 0.63]
+GAUGE_DOMAIN = {"x": [0.73, 1.0], "y": [0.0, 1.0]}
+FIG_LAYOUT = {
+    "template": template,
+    "title": {"text": "How Each Input Contributed to Your Total Risk"},
+    "yaxis": {"title": {"text": "Contribution to Risk (%)"}, "range": [0, 100], "ticksuffix": "%"},
+    "xaxis": {"tickangle": -45, "domain": BAR_DOMAIN},
+    "margin": {"t": 60, "b": 120},
+}
+
+# ── Display results & SHAP contributions ───────────────────────────────────────
+prob = st.session_state.prediction_prob
+pct  = prob * 100
+
+st.markdown(f"### 🧠 Your Stroke Percentage Risk: **{pct:.2f}%**")
+st.write("---")
+
+# The chart slot sits above the buttons, but the buttons are read first so a
+# navigation click leaves before any attribution or plotting work
+chart_slot = st.container()
+
+# Navigation buttons
+col1, col2 = st.columns(2)
+with col1:
+    back_clicked = st.button("🔙 Back to Assessment")
+with col2:
+    rec_clicked = st.button("📘 Recommendations")
+if back_clicked:
+    st.switch_page("pages/Risk_Assessment.py")
+if rec_clicked:
+    st.switch_page("pages/Recommendations.py")
+
+# A risk that displays as 0.00% has nothing to attribute; skip the SHAP pass and chart
+if round(pct, 2) == 0:
+    chart_slot.info("Risk ~0%: no meaningful feature attribution.")
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+    st.stop()
+
+UD = st.session_state.user_data
+# Rebuild raw feature vector in training order; age and glucose are rounded to
+# whole years and 0.1 mg/dL so nearby inputs share a cached attribution
+raw = (
+    int(round(UD["age"])),
+    round(float(UD["avg_glucose_level"]), 1),
+    YES_NO[UD["heart_disease"]],
+    YES_NO[UD["hypertension"]],
+    YES_NO[UD["ever_married"]],
+    SMOKING[UD["smoking_status"]],
+    WORK[UD["work_type"]],
+    GENDER[UD["gender"]],
+)
+
+# Reuse the last render's contributions and figure while inputs are unchanged
+h = hash((raw, prob))
+cached = st.session_state.get("_results_cache", (None,))
+if cached[0] == h:
+    _, contrib, fig = cached
+else:
+    # Feature attributions (cached per input tuple) as a share of risk, in percent;
+    # the cache hands back a fresh copy, so normalize it in place
+    contrib = compute_contrib(raw, model_mtime)
+    # (all-zero attributions, e.g. a constant model, stay at zero rather than NaN)
+    total = np.abs(contrib, out=contrib).sum()
+    np.multiply(contrib, 100 * prob / total if total else 0.0, out=contrib)
+
+    # Gauge bar shades from green to red with risk
+    r = int(255 * prob)
+    g = int(255 * (1 - prob))
+    bar_color = f"rgb({r},{g},0)"
+
+    # Contribution bar chart beside the overall gauge, in a single figure
+    # (plain dicts; validation skipped on this hot path)
+    fig = go.Figure({
+        "data": [{
+            "type": "bar",
+            "x": FEATURE_NAMES,
+            "y": contrib,
+            "marker": {"color": BAR_COLORS},
+            "text": list(map("{:.2f}%".format, contrib.tolist())),
+            "textposition": "outside",
+        }, {
+            "type": "indicator",
+            "domain": GAUGE_DOMAIN,
+            "mode": "gauge+number",
+            "value": pct,
+            "number": {"suffix": "%"},
+            "title": {"text": "Overall Stroke Risk (%)"},
+            "gauge": {
+                "axis": {"range": [0, 100], "ticksuffix": "%"},
+                "bar": {"color": bar_color},
+                "steps": [{"range": [0, 50], "color": "green"}, {"range": [50, 100], "color": "red"}],
+            },
+        }],
+        "layout": FIG_LAYOUT,
+    }, _validate=False)
+    st.session_state["_results_cache"] = (h, contrib, fig)
+
+# The bars are fixed, so by default Plotly.js draws a static plot with no hover,
+# zoom or modebar setup; sessions can opt back in with static_mode=False. A stable
+# key keeps the same chart element across reruns rather than remounting it
+chart_slot.plotly_chart(fig, use_container_width=True, key="contrib_chart",
+                        config={"staticPlot": st.session_state.get("static_mode", True),
+                                "displayModeBar": False})
+
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 
@@ -1,7 +1,22 @@
 # feutils.py  — helper module for the stroke pipeline
+import numpy as np
+
 def engineer_feats(df):
+    if isinstance(df, np.ndarray):
+        return engineer_feats_np(df)
     df = df.copy()
     df["age_sq"]      = df["age"]**2
     df["glucose_sq"]  = df["avg_glucose_level"]**2
     df["age_glucose"] = df["age"] * df["avg_glucose_level"]
     return df
+
+def engineer_feats_np(X, age_col=0, glu_col=1):
+    # Array fast path: same three columns, in the same order, without a frame copy
+    n, k = X.shape
+    out = np.empty((n, k + 3), dtype=np.result_type(X.dtype, np.float32))
+    out[:, :k] = X
+    age, glu = X[:, age_col], X[:, glu_col]
+    np.multiply(age, age, out=out[:, k])
+    np.multiply(glu, glu, out=out[:, k + 1])
+    np.multiply(age, glu, out=out[:, k + 2])
+    return out